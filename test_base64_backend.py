@@ -0,0 +1,54 @@
+"""
+Base64 backend check for the Python test environment.
+
+test_constants.py decodes the two well-formed nonces with pybase64 when it is
+installed. This checks that backend against the stdlib decoder, so it is kept
+apart from test_brc104_signatures.py and its cross-language test counts.
+"""
+
+import binascii
+
+import pytest
+
+from test_constants import (
+    INITIAL_NONCE_B64,
+    SESSION_NONCE_B64,
+    INITIAL_NONCE_BYTES,
+    SESSION_NONCE_BYTES,
+    INCORRECT_CONCAT_SIG_DATA,
+)
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+@pytest.mark.skipif(pybase64 is None, reason="pybase64 not installed")
+class TestPybase64Backend:
+    """Test that pybase64 is only relied on where it matches the stdlib."""
+
+    def test_nonces_decode_identically(self):
+        """
+        Test that pybase64 and binascii agree on the well-formed nonces.
+        """
+        assert pybase64.b64decode(INITIAL_NONCE_B64) == binascii.a2b_base64(INITIAL_NONCE_B64)
+        assert pybase64.b64decode(SESSION_NONCE_B64) == binascii.a2b_base64(SESSION_NONCE_B64)
+        assert INITIAL_NONCE_BYTES == binascii.a2b_base64(INITIAL_NONCE_B64)
+        assert SESSION_NONCE_BYTES == binascii.a2b_base64(SESSION_NONCE_B64)
+
+    def test_concatenated_nonces_need_lenient_decoder(self):
+        """
+        Test why INCORRECT_CONCAT_SIG_DATA is pinned to binascii.
+
+        pybase64 rejects the mid-string padding that the TypeScript decoder
+        (and binascii) silently accept.
+        """
+        with pytest.raises(binascii.Error):
+            pybase64.b64decode(INITIAL_NONCE_B64 + SESSION_NONCE_B64)
+
+        assert INCORRECT_CONCAT_SIG_DATA == binascii.a2b_base64(INITIAL_NONCE_B64 + SESSION_NONCE_B64)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
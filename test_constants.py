@@ -5,26 +5,80 @@ These constants are shared across Python, TypeScript, and Go test suites
 to ensure identical inputs produce identical outputs.
 """
 
-import base64
+from binascii import a2b_base64
+from typing import Final, Tuple
+
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from binascii import a2b_base64 as _b64decode
+
+__all__ = [
+    "TEST_PRIVATE_KEY_WIF",
+    "INITIAL_NONCE_B64",
+    "SESSION_NONCE_B64",
+    "INITIAL_NONCE_BYTES",
+    "SESSION_NONCE_BYTES",
+    "SIG_DATA_SIGNING",
+    "SIG_DATA_VERIFICATION",
+    "INCORRECT_CONCAT_SIG_DATA",
+    "PROTOCOL_ID",
+    "make_key_id",
+    "TEST_COUNTERPARTY_KEY",
+    "EXPECTED_SIG_DATA_SIGNING",
+    "EXPECTED_SIG_DATA_VERIFICATION",
+    "TEST_MESSAGE",
+    "TEST_TIMEOUT",
+]
 
 # Private key in WIF format (fixed for testing)
-TEST_PRIVATE_KEY_WIF = "L4B2postXdaP7TiUrUBYs53Fqzheu7WhSoQVPuY8qBdoBeEwbmZx"
+TEST_PRIVATE_KEY_WIF: Final[str] = "L4B2postXdaP7TiUrUBYs53Fqzheu7WhSoQVPuY8qBdoBeEwbmZx"
 
 # Test nonces (32 bytes each, base64 encoded)
 # These are fixed values to ensure deterministic testing
 INITIAL_NONCE_B64 = "QUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUE="  # 32 bytes of 'A' characters
 SESSION_NONCE_B64 = "QkJCQkJCQkJCQkJCQkJCQkJCQkJCQkJCQkJCQkJCQkI="  # 32 bytes of 'B' characters
 
-# Decode to bytes for direct use
-INITIAL_NONCE_BYTES = base64.b64decode(INITIAL_NONCE_B64)
-SESSION_NONCE_BYTES = base64.b64decode(SESSION_NONCE_B64)
+# Byte constants are decoded lazily on first attribute access (PEP 562).
+# The saving only applies to test_key_derivation.py, which needs just the
+# base64 strings and key ID helper; the other test files import (and so
+# decode) every byte constant.
+_LAZY_CONSTANTS = {
+    # Decode to bytes for direct use
+    "INITIAL_NONCE_BYTES": lambda: _b64decode(INITIAL_NONCE_B64),
+    "SESSION_NONCE_BYTES": lambda: _b64decode(SESSION_NONCE_B64),
+    # Signature data assembled from the decoded nonces
+    # For signing: initial_nonce_bytes + session_nonce_bytes
+    "SIG_DATA_SIGNING": lambda: _lazy("INITIAL_NONCE_BYTES") + _lazy("SESSION_NONCE_BYTES"),
+    # For verification: session_nonce_bytes + initial_nonce_bytes
+    "SIG_DATA_VERIFICATION": lambda: _lazy("SESSION_NONCE_BYTES") + _lazy("INITIAL_NONCE_BYTES"),
+    # Historical TypeScript bug: base64 strings concatenated first, then decoded.
+    # Always decoded leniently with binascii, like the TypeScript decoder: the
+    # string has padding mid-way, which strict decoders such as pybase64 reject.
+    "INCORRECT_CONCAT_SIG_DATA": lambda: a2b_base64(INITIAL_NONCE_B64 + SESSION_NONCE_B64),
+}
+
+def _lazy(name: str) -> bytes:
+    """Compute a lazy constant on first use and memoize it as a module global."""
+    module_globals = globals()
+    if name not in module_globals:
+        module_globals[name] = _LAZY_CONSTANTS[name]()
+    return module_globals[name]
+
+def __getattr__(name: str) -> bytes:
+    if name in _LAZY_CONSTANTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CONSTANTS))
 
 # Protocol parameters for BRC-104 authentication
-PROTOCOL_ID = [2, "auth message signature"]  # Security level 2, protocol name
+PROTOCOL_ID: Final[Tuple[int, str]] = (2, "auth message signature")  # Security level 2, protocol name
 
 # Key ID format: "{initial_nonce} {session_nonce}"
 def make_key_id(initial_nonce: str, session_nonce: str) -> str:
-    return f"{initial_nonce} {session_nonce}"
+    return " ".join((initial_nonce, session_nonce))
 
 # Test counterparty (identity key) - using a fixed public key for testing
 # This should be derived from TEST_PRIVATE_KEY_WIF, but for simplicity we'll use a fixed value
@@ -9,32 +9,61 @@ import sys
 import os
 import json
 import base64
+import functools
+import importlib.util
+
+try:
+    import pytest
+except ImportError:  # running standalone via compare_key_derivation.sh
+    pytest = None
 
 # Add py-sdk to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'py-sdk'))
 
-from bsv.wallet.key_deriver import KeyDeriver, Protocol, Counterparty, CounterpartyType
-from bsv.keys import PrivateKey, PublicKey
 from test_constants import (
     TEST_PRIVATE_KEY_WIF,
     INITIAL_NONCE_B64,
     SESSION_NONCE_B64,
+    PROTOCOL_ID,
     make_key_id,
-    TEST_COUNTERPARTY_KEY
+    TEST_COUNTERPARTY_KEY,
 )
 
+# The bsv SDK is imported inside the functions that need it, so collecting
+# this file alongside the lighter signature tests stays cheap.
+if pytest is not None:
+    pytestmark = pytest.mark.skipif(
+        importlib.util.find_spec('bsv') is None, reason='bsv SDK not installed'
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deriver(wif):
+    """Create (once per WIF) a key deriver rooted at the given private key."""
+    from bsv.keys import PrivateKey
+    from bsv.wallet.key_deriver import KeyDeriver
+
+    root_key = PrivateKey(wif)
+    return KeyDeriver(root_key)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_counterparty(counterparty_hex):
+    """Build (once per hex string) an OTHER counterparty for the given key."""
+    from bsv.keys import PublicKey
+    from bsv.wallet.key_deriver import Counterparty, CounterpartyType
+
+    counterparty_pub = PublicKey(counterparty_hex)
+    return Counterparty(CounterpartyType.OTHER, counterparty_pub)
+
 
 def derive_keys_python(protocol, key_id, counterparty_hex, for_self=False):
     """Derive keys using Python SDK."""
-    # Create root key from WIF
-    root_key = PrivateKey(TEST_PRIVATE_KEY_WIF)
+    # Create key deriver from the root WIF
+    key_deriver = _get_deriver(TEST_PRIVATE_KEY_WIF)
     
-    # Create key deriver
-    key_deriver = KeyDeriver(root_key)
-    
-    # Create counterparty public key
-    counterparty_pub = PublicKey(counterparty_hex)
-    counterparty = Counterparty(CounterpartyType.OTHER, counterparty_pub)
+    # Create counterparty from its public key
+    counterparty = _get_counterparty(counterparty_hex)
     
     # Derive private key
     derived_priv = key_deriver.derive_private_key(protocol, key_id, counterparty)
@@ -44,17 +73,25 @@ def derive_keys_python(protocol, key_id, counterparty_hex, for_self=False):
     derived_pub_not_for_self = key_deriver.derive_public_key(protocol, key_id, counterparty, for_self=False)
     
     return {
-        'private_key_hex': derived_priv.hex(),
-        'public_key_for_self_hex': derived_pub_for_self.hex(),
-        'public_key_not_for_self_hex': derived_pub_not_for_self.hex(),
-        'public_key_from_private_hex': derived_priv.public_key().hex()
+        'private_key': derived_priv.serialize(),
+        'public_key_for_self': derived_pub_for_self.serialize(),
+        'public_key_not_for_self': derived_pub_not_for_self.serialize(),
+        'public_key_from_private': derived_priv.public_key().serialize()
     }
 
 
+def _as_hex(results):
+    """Hex-encode derived key bytes, suffixing each key name with '_hex'."""
+    return {f'{k}_hex': v.hex() for k, v in results.items()}
+
+
 def test_key_derivation():
     """Test key derivation and output results for comparison."""
+    from bsv.wallet.key_deriver import Protocol
+
     # Test parameters matching BRC-104 general message scenario
-    protocol = Protocol(security_level=2, protocol="auth message signature")
+    security_level, protocol_name = PROTOCOL_ID
+    protocol = Protocol(security_level=security_level, protocol=protocol_name)
     key_id = make_key_id(INITIAL_NONCE_B64, SESSION_NONCE_B64)
     counterparty_hex = TEST_COUNTERPARTY_KEY
     
@@ -68,12 +105,13 @@ def test_key_derivation():
     
     # Derive keys
     results = derive_keys_python(protocol, key_id, counterparty_hex)
+    hex_results = _as_hex(results)
     
     print("Derived Keys:")
-    print(f"  Private Key (hex): {results['private_key_hex']}")
-    print(f"  Public Key (from private): {results['public_key_from_private_hex']}")
-    print(f"  Public Key (forSelf=True): {results['public_key_for_self_hex']}")
-    print(f"  Public Key (forSelf=False): {results['public_key_not_for_self_hex']}")
+    print(f"  Private Key (hex): {hex_results['private_key_hex']}")
+    print(f"  Public Key (from private): {hex_results['public_key_from_private_hex']}")
+    print(f"  Public Key (forSelf=True): {hex_results['public_key_for_self_hex']}")
+    print(f"  Public Key (forSelf=False): {hex_results['public_key_not_for_self_hex']}")
     print()
     
     # Output JSON for comparison
@@ -85,17 +123,17 @@ def test_key_derivation():
         },
         'key_id': key_id,
         'counterparty': counterparty_hex,
-        'results': results
+        'results': hex_results
     }
     
     print("JSON Output (for comparison):")
-    print(json.dumps(output, indent=2))
+    print(json.dumps(output, separators=(',', ':')))
     print()
     
     # Verify consistency
     print("Consistency Checks:")
-    print(f"  Public key from private matches forSelf=True: {results['public_key_from_private_hex'] == results['public_key_for_self_hex']}")
-    print(f"  Public key from private matches forSelf=False: {results['public_key_from_private_hex'] == results['public_key_not_for_self_hex']}")
+    print(f"  Public key from private matches forSelf=True: {results['public_key_from_private'] == results['public_key_for_self']}")
+    print(f"  Public key from private matches forSelf=False: {results['public_key_from_private'] == results['public_key_not_for_self']}")
     print()
     
     return output
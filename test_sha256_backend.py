@@ -0,0 +1,46 @@
+"""
+SHA-256 backend check for the Python test environment.
+
+The BRC-104 signature data is pre-hashed with SHA-256 before signing. This
+checks how the interpreter's hashlib was built, not BRC-104 logic, so it is
+kept apart from test_brc104_signatures.py and its cross-language test counts.
+"""
+
+import hashlib
+import platform
+
+import pytest
+
+
+def _cpu_has_sha_ni() -> bool:
+    """Whether the host CPU advertises the Intel SHA extensions (Linux only)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "sha_ni" in f.read().split()
+    except OSError:
+        return False
+
+
+class TestSHA256Backend:
+    """Test that the SHA-256 pre-hash runs on the accelerated OpenSSL backend."""
+
+    @pytest.fixture
+    def sha256_impl(self):
+        return hashlib.new("sha256")
+
+    @pytest.mark.skipif(
+        platform.machine() not in ("x86_64", "AMD64") or not _cpu_has_sha_ni(),
+        reason="SHA-NI not available on this host",
+    )
+    def test_sha256_uses_openssl(self, sha256_impl):
+        """
+        Test that hashlib routes SHA-256 through OpenSSL EVP on SHA-NI hosts.
+
+        OpenSSL picks up the SHA extensions at runtime; the builtin fallback
+        implementation does not.
+        """
+        assert type(sha256_impl).__module__ == "_hashlib"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])